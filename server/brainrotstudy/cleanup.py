@@ -0,0 +1,93 @@
+"""Periodic retention sweep: drop finished jobs older than the retention window.
+
+Disabled unless ``RETENTION_DAYS`` is set to a positive number; the sweep runs
+in the API process like the pipeline does, with the blocking filesystem work
+handed to a thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import shutil
+from datetime import timedelta
+from pathlib import Path
+
+from . import db
+from .config import get_settings
+from .pipeline import visuals
+from .schemas import utc_now
+from .storage import job_paths
+
+log = logging.getLogger(__name__)
+
+
+def dir_size_bytes(root: Path) -> int:
+    """Total size of a tree via an iterative scandir walk.
+
+    scandir reuses the directory entry for both type and stat info, so this
+    costs one pass per directory instead of os.walk's join/stat churn.
+    """
+    total = 0
+    stack = [str(root)]
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        total += entry.stat(follow_symlinks=False).st_size
+        except FileNotFoundError:
+            continue
+    return total
+
+
+def cleanup_old_jobs() -> int:
+    """Delete finished jobs whose last update predates the retention window.
+
+    Returns the number of jobs removed.
+    """
+    settings = get_settings()
+    if settings.retention_days <= 0:
+        return 0
+    cutoff = utc_now() - timedelta(days=settings.retention_days)
+    removed = 0
+    # Ask for exactly the expired rows: paging list_jobs (newest first) never
+    # reached the oldest jobs once more than a page's worth was retained.
+    while batch := db.list_finished_before(cutoff):
+        for view in batch:
+            # Only walk directories we are about to delete; sizing every
+            # retained job made the sweep O(total files), not O(expired files).
+            root = job_paths(view.id).root
+            size = dir_size_bytes(root)
+            db.delete_job(view.id)
+            shutil.rmtree(root, ignore_errors=True)
+            removed += 1
+            log.info("cleaned up job %s, reclaimed %.1f MB", view.id, size / 1e6)
+    pruned = visuals.prune_cache()
+    if pruned:
+        log.info("pruned %d expired visuals cache entries", pruned)
+    return removed
+
+
+async def run_periodic(stop: asyncio.Event | None = None) -> None:
+    """Run the sweep at the configured interval until ``stop`` is set.
+
+    The between-sweep wait parks on the stop event rather than sleeping
+    blindly, so shutdown wakes it immediately instead of after up to six
+    hours; plain task cancellation works too.
+    """
+    stop = stop or asyncio.Event()
+    interval = get_settings().cleanup_interval_hours * 3600
+    while not stop.is_set():
+        try:
+            await asyncio.to_thread(cleanup_old_jobs)
+        except Exception:
+            log.exception("cleanup sweep failed; will retry next interval")
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except TimeoutError:
+            continue
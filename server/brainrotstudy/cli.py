@@ -1,4 +1,11 @@
-"""Entry point: ``brainrotstudy`` starts the ASGI server with uvicorn."""
+"""Entry point: ``brainrotstudy`` starts the ASGI server with uvicorn.
+
+Runs a single worker on purpose: the event bus, the job-task registry, and
+the SQLite connection are all in-process, so concurrency comes from the
+event loop (uvloop, installed below) plus the pipeline's thread executor
+rather than from extra uvicorn workers. With uvicorn[standard] installed,
+the httptools protocol parser is picked up automatically.
+"""
 
 from __future__ import annotations
 
@@ -9,6 +16,15 @@ import os
 def main() -> None:
     import uvicorn
 
+    try:
+        # Bundled with uvicorn[standard]; libuv loop is ~2x faster than the
+        # default selector loop for SSE/upload-heavy workloads.
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     parser = argparse.ArgumentParser(prog="brainrotstudy")
     parser.add_argument("--host", default=os.environ.get("HOST", "0.0.0.0"))
     parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", "8000")))
@@ -47,6 +47,8 @@ class Settings(BaseSettings):
 
     # Stock imagery
     pexels_api_key: str | None = None
+    images_provider: Literal["auto", "pexels", "openverse", "card"] = "auto"
+    visuals_concurrency: int = 4  # parallel image fetches per job
 
     # Rendering
     ffmpeg_binary: str = "ffmpeg"
@@ -62,6 +64,10 @@ class Settings(BaseSettings):
     max_upload_mb: int = 100
     max_concurrent_jobs: int = 2
 
+    # Retention: delete finished jobs older than this many days (0 = keep forever)
+    retention_days: int = 0
+    cleanup_interval_hours: int = 6
+
     def resolve_storage(self) -> Path:
         """Return an absolute, existing storage root."""
         root = self.storage_root.expanduser().resolve()
@@ -9,9 +9,9 @@ from __future__ import annotations
 
 import sqlite3
 import threading
+from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Iterator
 
 from .config import get_settings
 from .schemas import JobOptions, JobStage, JobStatus, JobView, utc_now
@@ -37,6 +37,17 @@ CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs(created_at DESC);
 _lock = threading.Lock()
 _conn: sqlite3.Connection | None = None
 
+# get_job is hit by every job endpoint and every SSE connect. All writes go
+# through this module, so an invalidate-on-write cache is exact — no TTL
+# guesswork needed. Bounded so an old process can't accumulate rows forever.
+_VIEW_CACHE_MAX = 256
+_view_cache: dict[str, JobView] = {}
+
+
+def _cache_invalidate(job_id: str) -> None:
+    with _lock:
+        _view_cache.pop(job_id, None)
+
 
 def _connect() -> sqlite3.Connection:
     global _conn
@@ -109,9 +120,29 @@ def create_job(
 
 
 def get_job(job_id: str) -> JobView | None:
-    with _cursor() as cur:
-        row = cur.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
-    return _row_to_view(row) if row else None
+    # The row read and the cache store share one critical section (note:
+    # _cursor would re-take _lock, hence the inline cursor). Otherwise a
+    # reader holding a pre-update row could be preempted by update_job's
+    # invalidate and then store its stale view over the fresh one — with a
+    # terminal status write, that stale entry would never be invalidated.
+    conn = _connect()
+    with _lock:
+        cached = _view_cache.get(job_id)
+        if cached is not None:
+            # Copy so callers (e.g. artifact decoration) can't mutate the cache.
+            return cached.model_copy()
+        cur = conn.cursor()
+        try:
+            row = cur.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        finally:
+            cur.close()
+        if row is None:
+            return None
+        view = _row_to_view(row)
+        if len(_view_cache) >= _VIEW_CACHE_MAX:
+            _view_cache.pop(next(iter(_view_cache)))
+        _view_cache[job_id] = view
+        return view.model_copy()
 
 
 def list_jobs(limit: int = 50) -> list[JobView]:
@@ -122,6 +153,21 @@ def list_jobs(limit: int = 50) -> list[JobView]:
     return [_row_to_view(r) for r in rows]
 
 
+def list_finished_before(cutoff: datetime, limit: int = 500) -> list[JobView]:
+    """Finished jobs last updated before ``cutoff``, oldest first.
+
+    Timestamps are stored as ISO-8601 with a fixed UTC offset, so the string
+    comparison below orders the same way the datetimes do.
+    """
+    with _cursor() as cur:
+        rows = cur.execute(
+            "SELECT * FROM jobs WHERE status IN (?, ?) AND updated_at < ? "
+            "ORDER BY updated_at ASC LIMIT ?",
+            (JobStatus.SUCCEEDED.value, JobStatus.FAILED.value, cutoff.isoformat(), limit),
+        ).fetchall()
+    return [_row_to_view(r) for r in rows]
+
+
 def update_job(
     job_id: str,
     *,
@@ -152,13 +198,19 @@ def update_job(
 
     with _cursor() as cur:
         cur.execute(f"UPDATE jobs SET {set_clause} WHERE id = ?", values)
+    _cache_invalidate(job_id)
     return get_job(job_id)
 
 
 def delete_job(job_id: str) -> bool:
     with _cursor() as cur:
         cur.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
-        return cur.rowcount > 0
+        deleted = cur.rowcount > 0
+    # Invalidate after the write, like update_job: invalidating first left a
+    # window where a concurrent get_job could re-cache the doomed row and,
+    # with no later write to evict it, serve the deleted job forever.
+    _cache_invalidate(job_id)
+    return deleted
 
 
 # -- test hook --------------------------------------------------------------
@@ -166,6 +218,7 @@ def delete_job(job_id: str) -> bool:
 def _reset_for_tests() -> None:
     """Close the cached connection so tests can redirect the DB path."""
     global _conn
+    _view_cache.clear()
     if _conn is not None:
         _conn.close()
         _conn = None
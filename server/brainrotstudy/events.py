@@ -3,54 +3,118 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
-from typing import AsyncIterator
+from collections import defaultdict, deque
+from collections.abc import AsyncIterator
 
 from .schemas import ProgressEvent
 
+# Hard ceilings so a flood of clients (or of finished jobs) cannot grow the
+# bus without bound: queues are already capped at 64 events apiece.
+MAX_SUBSCRIBERS_PER_JOB = 100
+_MAX_CLOSED_REMEMBERED = 512
+
+
+def sse_frame(event: ProgressEvent) -> bytes:
+    """Render an event as a wire-ready SSE frame."""
+    return f"data: {event.model_dump_json()}\n\n".encode()
+
+
+# SSE comment line; clients ignore it, but it keeps idle connections alive
+# through proxies with read timeouts.
+KEEPALIVE_FRAME = b": keep-alive\n\n"
+
+
+# What flows through subscriber queues: the event (so consumers can inspect
+# status) plus its frame, serialized once per publish rather than once per
+# subscriber. None signals end-of-stream.
+_QueueItem = tuple[ProgressEvent, bytes]
+
 
 class EventBus:
-    """Fan-out async queue: one publisher, many subscribers per job."""
+    """Fan-out async queue: one publisher, many subscribers per job.
+
+    Everything here runs on the single application event loop and every
+    method mutates state without awaiting in between, so no lock is needed:
+    publish is one synchronous pass pushing the event into every subscriber
+    queue, which is as close to ``websockets.broadcast`` as asyncio gets.
+    """
 
     def __init__(self) -> None:
-        self._subs: dict[str, set[asyncio.Queue[ProgressEvent | None]]] = defaultdict(set)
-        self._lock = asyncio.Lock()
+        self._subs: dict[str, set[asyncio.Queue[_QueueItem | None]]] = defaultdict(set)
+        self._closed: set[str] = set()
+        self._closed_order: deque[str] = deque()
+
+    def subscriber_count(self, job_id: str) -> int:
+        return len(self._subs.get(job_id, ()))
 
     async def publish(self, event: ProgressEvent) -> None:
-        async with self._lock:
-            queues = list(self._subs.get(event.id, ()))
+        queues = self._subs.get(event.id)
+        if not queues:
+            return
+        item = (event, sse_frame(event))
         for q in queues:
             try:
-                q.put_nowait(event)
+                q.put_nowait(item)
             except asyncio.QueueFull:
                 # subscriber is too slow; drop the event rather than blocking the pipeline
                 pass
 
     async def close(self, job_id: str) -> None:
         """Signal end-of-stream to all subscribers of a job."""
-        async with self._lock:
-            queues = list(self._subs.get(job_id, ()))
-        for q in queues:
+        if job_id not in self._closed:
+            self._closed.add(job_id)
+            self._closed_order.append(job_id)
+            while len(self._closed_order) > _MAX_CLOSED_REMEMBERED:
+                self._closed.discard(self._closed_order.popleft())
+        for q in self._subs.get(job_id, ()):
             try:
                 q.put_nowait(None)
             except asyncio.QueueFull:
                 pass
 
-    async def subscribe(self, job_id: str) -> AsyncIterator[ProgressEvent]:
-        q: asyncio.Queue[ProgressEvent | None] = asyncio.Queue(maxsize=64)
-        async with self._lock:
-            self._subs[job_id].add(q)
+    async def subscribe(
+        self, job_id: str, *, heartbeat_sec: float | None = None
+    ) -> AsyncIterator[tuple[ProgressEvent | None, bytes]]:
+        """Yield (event, frame) pairs; with ``heartbeat_sec`` set, a
+        (None, keepalive) pair is yielded whenever the queue stays quiet that
+        long. The wait itself blocks on the queue — no polling interval."""
+        if job_id in self._closed:
+            # The pipeline already finished; don't leave the subscriber hanging
+            # on a queue that will never receive another event.
+            return
+        q: asyncio.Queue[_QueueItem | None] = asyncio.Queue(maxsize=64)
+        self._subs[job_id].add(q)
         try:
             while True:
-                evt = await q.get()
-                if evt is None:
+                if heartbeat_sec is None:
+                    item = await q.get()
+                else:
+                    try:
+                        item = await asyncio.wait_for(q.get(), heartbeat_sec)
+                    except TimeoutError:
+                        yield None, KEEPALIVE_FRAME
+                        continue
+                if item is None:
+                    return
+                # Coalesce any backlog: each event carries the full job state,
+                # so a subscriber that fell behind only needs the newest one.
+                end_of_stream = False
+                while True:
+                    try:
+                        nxt = q.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    if nxt is None:
+                        end_of_stream = True
+                        break
+                    item = nxt
+                yield item
+                if end_of_stream:
                     return
-                yield evt
         finally:
-            async with self._lock:
-                self._subs[job_id].discard(q)
-                if not self._subs[job_id]:
-                    del self._subs[job_id]
+            self._subs[job_id].discard(q)
+            if not self._subs[job_id]:
+                del self._subs[job_id]
 
 
 bus = EventBus()
@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import os
+import re
 import shutil
+import time
 import uuid
+from functools import lru_cache
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import FileResponse, StreamingResponse
+from pydantic import ValidationError
 
-from . import db
+from . import cleanup, db, events
 from .config import get_settings
 from .events import bus
 from .pipeline.runner import submit_job
@@ -32,8 +37,31 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name
 
 _settings = get_settings()
 
+_ALLOWED_UPLOAD_EXTS = frozenset({".pdf", ".pptx", ".txt", ".md"})
+_UNSAFE_STEM_RE = re.compile(r"[^\w-]")
+
+class _SkipCompressionForDownloads:
+    """Strip Accept-Encoding on download paths before GZipMiddleware sees it.
+
+    MP4/JPEG/MP3 artifacts are already compressed; gzipping them burns CPU and
+    defeats FileResponse's chunked pass-through, so downloads bypass gzip.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and "/download/" in scope["path"]:
+            scope = dict(scope)
+            scope["headers"] = [
+                (k, v) for k, v in scope["headers"] if k != b"accept-encoding"
+            ]
+        await self.app(scope, receive, send)
+
+
 app = FastAPI(title="BrainRotStudy", version="2.0.0")
 app.add_middleware(GZipMiddleware, minimum_size=1024)
+app.add_middleware(_SkipCompressionForDownloads)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=_settings.cors_origins,
@@ -46,9 +74,22 @@ app.add_middleware(
 @app.on_event("startup")
 async def _startup() -> None:
     db._connect()
+    if _settings.retention_days > 0:
+        app.state.cleanup_stop = asyncio.Event()
+        app.state.cleanup_task = asyncio.create_task(
+            cleanup.run_periodic(app.state.cleanup_stop), name="cleanup"
+        )
     log.info("brainrotstudy ready; storage=%s", _settings.resolve_storage())
 
 
+@app.on_event("shutdown")
+async def _shutdown() -> None:
+    task = getattr(app.state, "cleanup_task", None)
+    if task is not None:
+        app.state.cleanup_stop.set()
+        await task
+
+
 @app.get("/health")
 async def health() -> dict[str, str]:
     return {"status": "ok"}
@@ -57,6 +98,13 @@ async def health() -> dict[str, str]:
 @app.get("/config")
 async def config() -> dict[str, object]:
     """Expose which providers are usable so the frontend can set expectations."""
+    return _config_payload()
+
+
+@lru_cache(maxsize=1)
+def _config_payload() -> dict[str, object]:
+    # Everything in here is fixed at process start (env-driven settings plus
+    # the ffmpeg PATH probe), so build the response dict exactly once.
     s = get_settings()
     return {
         "llm": {
@@ -66,7 +114,7 @@ async def config() -> dict[str, object]:
         },
         "tts": {"elevenlabs": bool(s.elevenlabs_api_key), "gtts": True},
         "images": {"pexels": bool(s.pexels_api_key), "openverse": True},
-        "ffmpeg": bool(shutil.which(s.ffmpeg_binary)),
+        "ffmpeg": _ffmpeg_available(s.ffmpeg_binary),
         "max_upload_mb": s.max_upload_mb,
     }
 
@@ -77,12 +125,18 @@ async def list_jobs() -> list[JobView]:
 
 
 @app.post("/jobs", response_model=JobView)
-async def create_job(request: Request) -> JobView:
+async def create_job(request: Request, background: BackgroundTasks) -> JobView:
     content_type = request.headers.get("content-type", "")
     job_id = uuid.uuid4().hex[:10]
     paths = job_paths(job_id).ensure()
 
     if content_type.startswith("multipart/form-data"):
+        # Reject obviously oversized uploads before parsing the body at all;
+        # the streamed copy below still enforces the cap on the actual bytes.
+        max_bytes = _settings.max_upload_mb * 1024 * 1024
+        declared = request.headers.get("content-length")
+        if declared and declared.isdigit() and int(declared) > max_bytes + (64 << 10):
+            raise HTTPException(413, f"File exceeds {_settings.max_upload_mb} MB limit.")
         form = await request.form()
         upload = form.get("file")
         options_json = form.get("options") or "{}"
@@ -90,13 +144,10 @@ async def create_job(request: Request) -> JobView:
             raise HTTPException(400, "Expected 'file' field.")
         options = _parse_options(options_json)
         ext = Path(upload.filename or "").suffix.lower()
-        if ext not in {".pdf", ".pptx", ".txt", ".md"}:
+        if ext not in _ALLOWED_UPLOAD_EXTS:
             raise HTTPException(400, "File must be one of: pdf, pptx, txt, md")
         target = paths.input_dir / (upload.filename or f"upload{ext}")
-        data = await upload.read()
-        if len(data) > _settings.max_upload_mb * 1024 * 1024:
-            raise HTTPException(413, f"File exceeds {_settings.max_upload_mb} MB limit.")
-        target.write_bytes(data)
+        await _stream_to_disk(upload, target, max_bytes=max_bytes)
         view = db.create_job(
             job_id,
             title=target.stem.replace("_", " "),
@@ -105,15 +156,16 @@ async def create_job(request: Request) -> JobView:
             options=options,
         )
     else:
-        body = await request.json()
-        payload = JobCreate.model_validate(body)
+        # One Rust-side pass from raw bytes to model; skips request.json()'s
+        # intermediate dict and the second validation walk.
+        payload = JobCreate.model_validate_json(await request.body())
         if not payload.topic or not payload.topic.strip():
             raise HTTPException(400, "Topic is required.")
         topic_file = paths.input_dir / "topic.txt"
         text = payload.topic.strip()
         if payload.outline:
             text = f"{text}\n{payload.outline.strip()}"
-        topic_file.write_text(text, encoding="utf-8")
+        await asyncio.to_thread(topic_file.write_text, text, encoding="utf-8")
         view = db.create_job(
             job_id,
             title=payload.topic.strip()[:120],
@@ -122,10 +174,19 @@ async def create_job(request: Request) -> JobView:
             options=payload.options,
         )
 
-    submit_job(job_id)
+    # Spawn the pipeline task after the response has been sent, keeping task
+    # setup off the request's critical path.
+    background.add_task(_spawn_job, job_id)
     return _with_artifacts([view])[0]
 
 
+async def _spawn_job(job_id: str) -> None:
+    # Async on purpose: Starlette awaits coroutine background tasks on the
+    # event loop, whereas a sync callable runs in a worker thread where
+    # submit_job has no running loop to create the pipeline task on.
+    submit_job(job_id)
+
+
 @app.get("/jobs/{job_id}", response_model=JobView)
 async def get_job(job_id: str) -> JobView:
     view = db.get_job(job_id)
@@ -140,9 +201,15 @@ async def delete_job(job_id: str) -> dict[str, str]:
     if view is None:
         raise HTTPException(404, "Job not found.")
     db.delete_job(job_id)
+    _artifact_cache.pop(job_id, None)
     root = job_paths(job_id).root
-    if root.exists():
-        shutil.rmtree(root)
+    # A job dir can hold a rendered video plus dozens of images; deleting it
+    # is real disk work that doesn't belong on the event loop. No exists()
+    # pre-check — a missing dir just means nothing to remove.
+    try:
+        await asyncio.to_thread(shutil.rmtree, root)
+    except FileNotFoundError:
+        pass
     return {"id": job_id, "deleted": "true"}
 
 
@@ -151,9 +218,11 @@ async def job_events(job_id: str) -> StreamingResponse:
     view = db.get_job(job_id)
     if view is None:
         raise HTTPException(404, "Job not found.")
+    if bus.subscriber_count(job_id) >= events.MAX_SUBSCRIBERS_PER_JOB:
+        raise HTTPException(503, "Too many listeners for this job; retry shortly.")
 
     async def gen():
-        yield "retry: 2000\n\n"
+        yield b"retry: 2000\n\n"
         view_now = db.get_job(job_id)
         if view_now is None:
             return
@@ -164,12 +233,12 @@ async def job_events(job_id: str) -> StreamingResponse:
             progress=view_now.progress,
             message=f"snapshot:{view_now.status.value}",
         )
-        yield _sse(snapshot)
+        yield events.sse_frame(snapshot)
         if view_now.status in (JobStatus.SUCCEEDED, JobStatus.FAILED):
             return
-        async for evt in bus.subscribe(job_id):
-            yield _sse(evt)
-            if evt.status in (JobStatus.SUCCEEDED, JobStatus.FAILED):
+        async for evt, frame in bus.subscribe(job_id, heartbeat_sec=15.0):
+            yield frame
+            if evt is not None and evt.status in (JobStatus.SUCCEEDED, JobStatus.FAILED):
                 return
 
     return StreamingResponse(
@@ -198,45 +267,104 @@ async def download(job_id: str, asset: str) -> FileResponse:
     if asset not in mapping:
         raise HTTPException(404, "Unknown asset.")
     path, mime, ext = mapping[asset]
-    if not path.exists():
-        raise HTTPException(404, f"{asset} not ready.")
+    try:
+        stat_result = path.stat()
+    except FileNotFoundError:
+        raise HTTPException(404, f"{asset} not ready.") from None
     safe = _safe_stem(view.title) or job_id
-    return FileResponse(path, media_type=mime, filename=f"{safe}{ext}")
+    # Hand the stat to FileResponse so it doesn't stat again; Starlette then
+    # serves the file (with Range support) straight from disk in chunks.
+    return FileResponse(path, media_type=mime, filename=f"{safe}{ext}", stat_result=stat_result)
 
 
 # ---------------------------------------------------------------------------
 
 
-def _safe_stem(title: str) -> str:
-    keep = [c if c.isalnum() or c in {"-", "_"} else "_" for c in title.strip()]
-    return "".join(keep)[:80].strip("_")
+@lru_cache(maxsize=4)
+def _ffmpeg_available(binary: str) -> bool:
+    """PATH lookup is a directory scan; the answer doesn't change at runtime."""
+    return bool(shutil.which(binary))
 
 
-def _parse_options(raw: object) -> JobOptions:
+_UPLOAD_CHUNK = 1 << 20  # 1 MiB
+
+
+async def _stream_to_disk(upload, target: Path, *, max_bytes: int) -> None:
+    """Copy an upload to disk in chunks so memory stays O(chunk), not O(file)."""
+    written = 0
     try:
-        data = json.loads(raw) if isinstance(raw, str) else {}
-    except json.JSONDecodeError:
-        data = {}
-    return JobOptions.model_validate(data)
+        with target.open("wb") as f:
+            while chunk := await upload.read(_UPLOAD_CHUNK):
+                written += len(chunk)
+                if written > max_bytes:
+                    raise HTTPException(413, f"File exceeds {max_bytes >> 20} MB limit.")
+                await asyncio.to_thread(f.write, chunk)
+    except HTTPException:
+        target.unlink(missing_ok=True)
+        raise
+
+
+@lru_cache(maxsize=256)
+def _safe_stem(title: str) -> str:
+    return _UNSAFE_STEM_RE.sub("_", title.strip())[:80].strip("_")
 
 
-def _sse(event: ProgressEvent) -> str:
-    return f"data: {event.model_dump_json()}\n\n"
+def _parse_options(raw: object) -> JobOptions:
+    if not isinstance(raw, str):
+        return JobOptions()
+    try:
+        # Rust-backed parse+validate in one pass; no intermediate dict.
+        return JobOptions.model_validate_json(raw)
+    except ValidationError as e:
+        if all(err.get("type") == "json_invalid" for err in e.errors()):
+            return JobOptions()  # malformed JSON falls back to defaults, as before
+        raise
+
+
+# Artifacts of a succeeded job only change when the job is deleted, so a short
+# TTL cache spares /jobs listings four stat() calls per job per request.
+# Bounded like the other in-process state (EventBus, view cache): jobs removed
+# by the retention sweep never get an explicit pop here.
+_ARTIFACT_TTL_SEC = 30.0
+_ARTIFACT_CACHE_MAX = 512
+_artifact_cache: dict[str, tuple[float, Artifacts]] = {}
+
+
+def _artifacts_for(job_id: str) -> Artifacts:
+    now = time.monotonic()
+    cached = _artifact_cache.get(job_id)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    paths = job_paths(job_id)
+    try:
+        # One directory read answers all four "does this artifact exist?"
+        # questions at once.
+        with os.scandir(paths.output_dir) as it:
+            present = {entry.name for entry in it}
+    except FileNotFoundError:
+        present = set()
+    arts = Artifacts()
+    if paths.video_path.name in present:
+        arts.video_url = f"/jobs/{job_id}/download/video"
+    if paths.srt_path.name in present:
+        arts.srt_url = f"/jobs/{job_id}/download/srt"
+    if paths.notes_path.name in present:
+        arts.notes_url = f"/jobs/{job_id}/download/notes"
+    if paths.anki_path.name in present:
+        arts.anki_url = f"/jobs/{job_id}/download/anki"
+    if len(_artifact_cache) >= _ARTIFACT_CACHE_MAX:
+        # Shed expired entries first; evict oldest-inserted if still full.
+        for key in [k for k, (exp, _) in _artifact_cache.items() if exp <= now]:
+            del _artifact_cache[key]
+        while len(_artifact_cache) >= _ARTIFACT_CACHE_MAX:
+            _artifact_cache.pop(next(iter(_artifact_cache)))
+    _artifact_cache[job_id] = (now + _ARTIFACT_TTL_SEC, arts)
+    return arts
 
 
 def _with_artifacts(views: list[JobView]) -> list[JobView]:
     for v in views:
         if v.status != JobStatus.SUCCEEDED:
             continue
-        paths = job_paths(v.id)
-        arts = Artifacts()
-        if paths.video_path.exists():
-            arts.video_url = f"/jobs/{v.id}/download/video"
-        if paths.srt_path.exists():
-            arts.srt_url = f"/jobs/{v.id}/download/srt"
-        if paths.notes_path.exists():
-            arts.notes_url = f"/jobs/{v.id}/download/notes"
-        if paths.anki_path.exists():
-            arts.anki_url = f"/jobs/{v.id}/download/anki"
-        v.artifacts = arts
+        v.artifacts = _artifacts_for(v.id)
     return views
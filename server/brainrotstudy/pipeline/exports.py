@@ -30,18 +30,19 @@ def write_anki(script: Script, path: Path) -> None:
     Cards = takeaways if present, else one card per segment.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    rows: list[tuple[str, str]] = []
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Front", "Back"])
+        writer.writerows(_anki_rows(script))
+
+
+def _anki_rows(script: Script):
+    """Yield (front, back) pairs; streamed so rows are never materialized."""
     if script.takeaways:
         for t in script.takeaways:
             front = t.split(":")[0].split("—")[0].strip() or t[:60]
-            back = t
-            rows.append((front, back))
+            yield front, t
     else:
         for seg in script.segments:
             front = (seg.visual_query or seg.text.split(".")[0]).strip()[:80]
-            rows.append((front, seg.text))
-
-    with path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["Front", "Back"])
-        writer.writerows(rows)
+            yield front, seg.text
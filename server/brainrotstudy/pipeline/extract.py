@@ -7,7 +7,6 @@ from pathlib import Path
 
 from ..schemas import ExtractedContent, ExtractedSection
 
-
 MAX_SECTIONS = 20
 MAX_BULLETS_PER_SECTION = 8
 MAX_BODY_CHARS_PER_SECTION = 1200
@@ -51,10 +50,14 @@ def _extract_pdf(path: Path) -> ExtractedContent:
         for page_idx, page in enumerate(doc):
             if len(sections) >= MAX_SECTIONS:
                 break
-            text = page.get_text("text").strip()
-            if not text:
+            # "blocks" gives layout-segmented text: the top-most block is the
+            # best heading candidate, and MuPDF has already done the line
+            # grouping that a raw get_text() dump would force us to redo.
+            blocks = [b for b in page.get_text("blocks") if b[6] == 0 and b[4].strip()]
+            if not blocks:
                 continue
-            section = _section_from_block(text, default_heading=f"Page {page_idx + 1}")
+            blocks.sort(key=lambda b: (b[1], b[0]))
+            section = _section_from_pdf_blocks(blocks, default_heading=f"Page {page_idx + 1}")
             if section.bullets or section.body:
                 sections.append(section)
     return ExtractedContent(title=title, source="pdf", sections=sections)
@@ -111,16 +114,13 @@ def _extract_pptx(path: Path) -> ExtractedContent:
 
 def _extract_text(path: Path) -> ExtractedContent:
     raw = path.read_text(encoding="utf-8", errors="replace")
-    lines = raw.splitlines()
     title = path.stem.replace("_", " ").replace("-", " ").title()
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("# "):
-            title = stripped[2:].strip()[:120]
-            break
-        if stripped:
-            title = stripped[:120]
-            break
+    # One C-level scan to the first non-blank line instead of splitting the
+    # whole document into a line list just to look at its head.
+    match = _FIRST_LINE_RE.search(raw)
+    if match:
+        first = match.group().rstrip()
+        title = (first[2:].strip() if first.startswith("# ") else first)[:120]
 
     sections = _sections_from_outline(raw)
     return ExtractedContent(title=title, source="text", sections=sections)
@@ -129,6 +129,7 @@ def _extract_text(path: Path) -> ExtractedContent:
 # ----- Helpers -------------------------------------------------------------
 
 
+_FIRST_LINE_RE = re.compile(r"\S[^\n]*")
 _HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$")
 _BULLET_RE = re.compile(r"^\s*[-*•]\s+(.+)$")
 
@@ -178,23 +179,31 @@ def _sections_from_outline(text: str) -> list[ExtractedSection]:
     return sections[:MAX_SECTIONS]
 
 
-def _section_from_block(text: str, *, default_heading: str) -> ExtractedSection:
-    """Best-effort split of free text into a heading + body."""
-    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-    if not lines:
-        return ExtractedSection(heading=default_heading)
+def _section_from_pdf_blocks(blocks: list, *, default_heading: str) -> ExtractedSection:
+    """Build a section from PyMuPDF ``get_text("blocks")`` tuples.
 
-    heading = lines[0][:120] if len(lines[0]) < 120 else default_heading
-    start_body_idx = 1 if heading != default_heading else 0
+    ``blocks`` must be non-empty, text-type, and sorted top-to-bottom.
+    """
+    texts = [b[4].strip() for b in blocks]
+    head, _, first_rest = texts[0].partition("\n")
+    head = head.strip()
+    if head and len(head) < 120:
+        heading = head[:120]
+        remainder = ([first_rest] if first_rest.strip() else []) + texts[1:]
+    else:
+        heading = default_heading
+        remainder = texts
 
     bullets: list[str] = []
     body_parts: list[str] = []
-    for ln in lines[start_body_idx:]:
-        bullet = _BULLET_RE.match(ln)
-        if bullet and len(bullets) < MAX_BULLETS_PER_SECTION:
-            bullets.append(bullet.group(1).strip())
-        else:
-            body_parts.append(ln)
+    for block in remainder:
+        # splitlines + map + filter run entirely in C; no per-line frame.
+        for ln in filter(None, map(str.strip, block.splitlines())):
+            bullet = _BULLET_RE.match(ln)
+            if bullet and len(bullets) < MAX_BULLETS_PER_SECTION:
+                bullets.append(bullet.group(1).strip())
+            else:
+                body_parts.append(ln)
 
     body = " ".join(body_parts)[:MAX_BODY_CHARS_PER_SECTION]
     return ExtractedSection(heading=heading, bullets=bullets, body=body)
@@ -7,11 +7,15 @@ exactly, without needing Whisper for forced alignment.
 from __future__ import annotations
 
 import logging
+import os
 import shutil
 import subprocess
 import wave
 from pathlib import Path
 
+import httpx
+from gtts import gTTS
+
 from ..config import Settings, get_settings
 from ..schemas import NarratedSegment, Script
 from ..storage import JobPaths
@@ -33,25 +37,40 @@ def narrate(
     provider = _pick_provider(settings)
     log.info("synthesizing %d segments with %s", len(script.segments), provider)
 
+    # One client for the whole job: per-segment clients paid a TLS handshake
+    # per line of narration.
+    client = httpx.Client(timeout=60.0) if provider == "elevenlabs" else None
+
     segments: list[NarratedSegment] = []
     cursor = 0.0
     segment_files: list[Path] = []
-    for idx, seg in enumerate(script.segments):
-        out_path = paths.audio_dir / f"seg_{idx:03d}.mp3"
-        _synthesize(seg.text, out_path, provider=provider, language=language, settings=settings)
-        duration = _duration_seconds(out_path)
-        segments.append(
-            NarratedSegment(
-                text=seg.text,
-                emphasis=seg.emphasis,
-                visual_query=seg.visual_query,
-                audio_path=str(out_path),
-                start_sec=cursor,
-                end_sec=cursor + duration,
+    try:
+        for idx, seg in enumerate(script.segments):
+            out_path = paths.audio_dir / f"seg_{idx:03d}.mp3"
+            _synthesize(
+                seg.text,
+                out_path,
+                provider=provider,
+                language=language,
+                settings=settings,
+                client=client,
             )
-        )
-        cursor += duration
-        segment_files.append(out_path)
+            duration = _duration_seconds(out_path)
+            segments.append(
+                NarratedSegment(
+                    text=seg.text,
+                    emphasis=seg.emphasis,
+                    visual_query=seg.visual_query,
+                    audio_path=str(out_path),
+                    start_sec=cursor,
+                    end_sec=cursor + duration,
+                )
+            )
+            cursor += duration
+            segment_files.append(out_path)
+    finally:
+        if client is not None:
+            client.close()
 
     voice_path = paths.voice_path
     _concat(segment_files, voice_path, settings=settings)
@@ -78,22 +97,22 @@ def _synthesize(
     provider: str,
     language: str,
     settings: Settings,
+    client: httpx.Client | None = None,
 ) -> None:
     if provider == "elevenlabs":
-        _synth_elevenlabs(text, out_path, settings=settings)
+        assert client is not None
+        _synth_elevenlabs(text, out_path, settings=settings, client=client)
         return
     _synth_gtts(text, out_path, language=language)
 
 
 def _synth_gtts(text: str, out_path: Path, *, language: str) -> None:
-    from gtts import gTTS
-
     gTTS(text=text, lang=language, slow=False).save(str(out_path))
 
 
-def _synth_elevenlabs(text: str, out_path: Path, *, settings: Settings) -> None:
-    import httpx
-
+def _synth_elevenlabs(
+    text: str, out_path: Path, *, settings: Settings, client: httpx.Client
+) -> None:
     url = f"https://api.elevenlabs.io/v1/text-to-speech/{settings.elevenlabs_voice_id}"
     headers = {
         "xi-api-key": settings.elevenlabs_api_key or "",
@@ -105,10 +124,9 @@ def _synth_elevenlabs(text: str, out_path: Path, *, settings: Settings) -> None:
         "model_id": "eleven_turbo_v2_5",
         "voice_settings": {"stability": 0.5, "similarity_boost": 0.75, "style": 0.4},
     }
-    with httpx.Client(timeout=60.0) as client:
-        resp = client.post(url, headers=headers, json=payload)
-        resp.raise_for_status()
-        out_path.write_bytes(resp.content)
+    resp = client.post(url, headers=headers, json=payload)
+    resp.raise_for_status()
+    out_path.write_bytes(resp.content)
 
 
 # ------- Duration and concatenation ---------------------------------------
@@ -150,7 +168,13 @@ def _concat(files: list[Path], out_path: Path, *, settings: Settings) -> None:
     if not files:
         raise RuntimeError("no audio segments to concatenate")
     if len(files) == 1:
-        out_path.write_bytes(files[0].read_bytes())
+        # Same filesystem by construction (both under the job dir), so a
+        # hardlink beats reading and rewriting the bytes; copy as fallback.
+        out_path.unlink(missing_ok=True)
+        try:
+            os.link(files[0], out_path)
+        except OSError:
+            shutil.copyfile(files[0], out_path)
         return
     ffmpeg = shutil.which(settings.ffmpeg_binary) or settings.ffmpeg_binary
     list_file = out_path.with_suffix(".concat.txt")
@@ -15,6 +15,7 @@ This module produces the final MP4. It requires `ffmpeg` to be on PATH.
 from __future__ import annotations
 
 import logging
+import re
 import shutil
 import subprocess
 from pathlib import Path
@@ -230,7 +231,5 @@ def _format_caption_text(text: str, emphasis: list[str]) -> str:
 
 
 def _replace_word_case_insensitive(text: str, word: str, wrap) -> str:
-    import re
-
     pattern = re.compile(rf"\b{re.escape(word)}\b", re.IGNORECASE)
     return pattern.sub(lambda m: wrap(m.group(0)), text)
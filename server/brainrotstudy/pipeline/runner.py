@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 from pathlib import Path
 
 from ..config import get_settings
@@ -52,9 +53,17 @@ async def run_job(job_id: str) -> None:
     loop = asyncio.get_running_loop()
 
     async def emit(stage: JobStage, pct: int, message: str) -> None:
-        update_job(job_id, status=JobStatus.RUNNING, stage=stage, progress=pct)
-        await bus.publish(
-            ProgressEvent(id=job_id, status=JobStatus.RUNNING, stage=stage, progress=pct, message=message)
+        event = ProgressEvent(
+            id=job_id, status=JobStatus.RUNNING, stage=stage, progress=pct, message=message
+        )
+        # Persist and publish together: subscribers get the event while the
+        # SQLite write runs on a worker thread instead of blocking the loop.
+        await asyncio.gather(
+            loop.run_in_executor(
+                None,
+                lambda: update_job(job_id, status=JobStatus.RUNNING, stage=stage, progress=pct),
+            ),
+            bus.publish(event),
         )
 
     try:
@@ -67,7 +76,7 @@ async def run_job(job_id: str) -> None:
         await emit(JobStage.SCRIPT, 15, "Writing your script…")
         script_obj = await loop.run_in_executor(None, script.generate_script, content, opts)
         update_job(job_id, title=script_obj.title)
-        paths.script_path.write_text(script_obj.model_dump_json(indent=2), encoding="utf-8")
+        paths.script_path.write_text(script_obj.model_dump_json(), encoding="utf-8")
         await emit(JobStage.SCRIPT, 30, f"Script: {len(script_obj.segments)} segments.")
 
         await emit(JobStage.NARRATE, 35, "Synthesizing narration…")
@@ -90,7 +99,7 @@ async def run_job(job_id: str) -> None:
             opts=opts,
             settings=settings,
         )
-        paths.timeline_path.write_text(timeline.model_dump_json(indent=2), encoding="utf-8")
+        paths.timeline_path.write_text(timeline.model_dump_json(), encoding="utf-8")
 
         await emit(JobStage.RENDER, 80, "Rendering video…")
         await loop.run_in_executor(None, render.render_video, timeline, paths)
@@ -139,7 +148,13 @@ async def run_job(job_id: str) -> None:
 
 def _do_extract(paths: JobPaths, input_filename: str | None, title: str, _placeholder):
     input_dir = paths.input_dir
-    files = sorted(p for p in input_dir.iterdir() if p.is_file()) if input_dir.exists() else []
+    try:
+        # scandir answers is_file() from the directory entry itself — one
+        # syscall for the whole listing instead of a stat per child.
+        with os.scandir(input_dir) as it:
+            files = sorted(Path(entry.path) for entry in it if entry.is_file())
+    except FileNotFoundError:
+        files = []
     topic_file = input_dir / "topic.txt"
     if topic_file in files:
         text = topic_file.read_text(encoding="utf-8")
@@ -149,7 +164,7 @@ def _do_extract(paths: JobPaths, input_filename: str | None, title: str, _placeh
         content = extract.extract_from_path(files[0])
     else:
         content = extract.extract_from_topic(title)
-    paths.extract_path.write_text(content.model_dump_json(indent=2), encoding="utf-8")
+    paths.extract_path.write_text(content.model_dump_json(), encoding="utf-8")
     return content
 
 
@@ -188,6 +203,10 @@ def _build_timeline(*, narrated, clips, voice_path: Path, opts, settings) -> Tim
 
 _semaphore: asyncio.Semaphore | None = None
 
+# Strong refs to in-flight tasks: the loop only keeps weak references, so a
+# bare create_task result can be garbage-collected mid-run.
+_tasks: set[asyncio.Task] = set()
+
 
 def _sem() -> asyncio.Semaphore:
     global _semaphore
@@ -204,4 +223,7 @@ async def _run_with_limit(job_id: str) -> None:
 def submit_job(job_id: str, *, loop: asyncio.AbstractEventLoop | None = None) -> asyncio.Task:
     """Schedule ``run_job`` on the running loop and return the Task."""
     loop = loop or asyncio.get_event_loop()
-    return loop.create_task(_run_with_limit(job_id), name=f"job:{job_id}")
+    task = loop.create_task(_run_with_limit(job_id), name=f"job:{job_id}")
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return task
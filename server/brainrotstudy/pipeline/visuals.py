@@ -8,12 +8,21 @@ title-card image so the pipeline still completes.
 from __future__ import annotations
 
 import hashlib
+import json
 import logging
+import os
 import random
+import shutil
 import textwrap
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 import httpx
+from PIL import Image, ImageDraw, ImageFont
 
 from ..config import Settings, get_settings
 from ..schemas import NarratedSegment, VisualClip
@@ -42,62 +51,231 @@ def fetch_visuals(
     settings = settings or get_settings()
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    owns_client = http_client is None
-    client = http_client or httpx.Client(timeout=20.0, follow_redirects=True)
+    client = http_client or _get_client()
+
+    # Fetches are network-bound and independent per segment; httpx.Client
+    # is thread-safe, so a bounded pool overlaps them instead of paying
+    # one round-trip after another. Submission order is playback order,
+    # so the earliest segments — the ones the render needs first — claim
+    # workers first.
+    breaker = _ProviderBreaker()
+    with ThreadPoolExecutor(max_workers=max(1, settings.visuals_concurrency)) as pool:
+        futures = [
+            pool.submit(
+                _fetch_one,
+                idx,
+                seg,
+                out_dir,
+                title=title,
+                settings=settings,
+                client=client,
+                breaker=breaker,
+            )
+            for idx, seg in enumerate(segments)
+        ]
+        return [f.result() for f in futures]
+
+
+# One client for the whole process: successive jobs reuse warm connections to
+# the same three hosts instead of paying TLS handshakes per job. Lazy so that
+# importing the module (e.g. in tests) opens nothing.
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = _make_client()
+        return _client
+
+
+def _reset_client() -> None:
+    # TLS/socket state must not survive fork() into a child process.
+    global _client
+    _client = None
+
+
+if hasattr(os, "register_at_fork"):  # not on Windows
+    os.register_at_fork(after_in_child=_reset_client)
+
+
+def _make_client() -> httpx.Client:
+    """HTTP/2 lets the parallel fetches multiplex one connection per host
+    instead of opening a socket per in-flight request."""
+    try:
+        return httpx.Client(timeout=20.0, follow_redirects=True, http2=True)
+    except ImportError:  # h2 extra not installed; HTTP/1.1 still works
+        return httpx.Client(timeout=20.0, follow_redirects=True)
+
+
+def _fetch_one(
+    idx: int,
+    seg: NarratedSegment,
+    out_dir: Path,
+    *,
+    title: str,
+    settings: Settings,
+    client: httpx.Client,
+    breaker: _ProviderBreaker,
+) -> VisualClip:
+    query = seg.visual_query or seg.text.split(".")[0]
+    target = out_dir / f"seg_{idx:03d}.jpg"
+    # IMAGES_PROVIDER pins one source (mirrors TTS_PROVIDER/LLM_PROVIDER);
+    # "auto" keeps the pexels → openverse → card cascade.
+    provider = settings.images_provider
+    clip = None
+    if provider in ("auto", "pexels"):
+        clip = _try_pexels(
+            query, target, client=client, api_key=settings.pexels_api_key, breaker=breaker
+        )
+    if clip is None and provider in ("auto", "openverse"):
+        clip = _try_openverse(query, target, client=client, breaker=breaker)
+    if clip is None:
+        log.info("no stock image for %r, rendering a title card", query)
+        clip = _render_card(
+            text=seg.text,
+            title=title,
+            idx=idx,
+            target=target.with_suffix(".png"),
+        )
+    return clip
+
+
+class _ProviderBreaker:
+    """Per-job circuit breaker: after a few consecutive failures, stop
+    offering a provider so the remaining segments skip straight to the next
+    source instead of each eating a timeout."""
+
+    def __init__(self, threshold: int = 3) -> None:
+        self._failures: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._threshold = threshold
+
+    def available(self, provider: str) -> bool:
+        with self._lock:
+            return self._failures.get(provider, 0) < self._threshold
+
+    def record(self, provider: str, *, ok: bool) -> None:
+        with self._lock:
+            self._failures[provider] = 0 if ok else self._failures.get(provider, 0) + 1
+
+
+# ------- Search-response cache --------------------------------------------
+
+# Study material repeats visual queries heavily ("mitochondria diagram" comes
+# up in every biology deck), so search responses are cached on disk under the
+# storage root and reused across jobs.
+_SEARCH_CACHE_TTL_SEC = 7 * 24 * 3600
+
+
+def _search_cache_dir() -> Path:
+    d = get_settings().resolve_storage() / "cache" / "visuals"
+    d.mkdir(parents=True, exist_ok=True)
+    return d
 
-    clips: list[VisualClip] = []
+
+def prune_cache(max_age_sec: float = _SEARCH_CACHE_TTL_SEC) -> int:
+    """Delete cached search responses and image blobs older than ``max_age_sec``.
+
+    The TTL only gates reads — nothing ever deleted stale entries, so on a
+    long-lived server every URL ever fetched stayed on disk. The retention
+    sweep calls this; job copies are separate hardlinks, so dropping a blob
+    never breaks an existing job's visuals. Returns the number removed.
+    """
+    cutoff = time.time() - max_age_sec
+    removed = 0
     try:
-        for idx, seg in enumerate(segments):
-            query = seg.visual_query or seg.text.split(".")[0]
-            target = out_dir / f"seg_{idx:03d}.jpg"
-            clip = _try_pexels(query, target, client=client, api_key=settings.pexels_api_key)
-            if clip is None:
-                clip = _try_openverse(query, target, client=client)
-            if clip is None:
-                log.info("no stock image for %r, rendering a title card", query)
-                clip = _render_card(
-                    text=seg.text,
-                    title=title,
-                    idx=idx,
-                    target=target.with_suffix(".png"),
-                )
-            clips.append(clip)
-    finally:
-        if owns_client:
-            client.close()
-    return clips
+        with os.scandir(_search_cache_dir()) as it:
+            for entry in it:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        removed += 1
+                except FileNotFoundError:
+                    continue  # concurrent fetch replaced it; fine
+    except FileNotFoundError:
+        return 0
+    return removed
+
+
+# Segments about the same concept produce identical queries; a per-key lock
+# makes concurrent fetch threads share one search instead of racing the API.
+_search_guard = threading.Lock()
+_search_locks: dict[tuple[str, str], threading.Lock] = {}
+
+
+def _cached_search(endpoint: str, query: str, fetch: Callable[[], dict]) -> dict:
+    """Return the JSON search response for (endpoint, query), from disk if fresh."""
+    with _search_guard:
+        lock = _search_locks.setdefault((endpoint, query), threading.Lock())
+    with lock:
+        try:
+            return _cached_search_locked(endpoint, query, fetch)
+        finally:
+            with _search_guard:
+                _search_locks.pop((endpoint, query), None)
+
+
+def _cached_search_locked(endpoint: str, query: str, fetch: Callable[[], dict]) -> dict:
+    key = hashlib.sha256(f"{endpoint}|{query}".encode()).hexdigest()[:32]
+    path = _search_cache_dir() / f"{endpoint}_{key}.json"
+    try:
+        if path.stat().st_mtime > time.time() - _SEARCH_CACHE_TTL_SEC:
+            return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        pass
+    data = fetch()
+    try:
+        path.write_text(json.dumps(data), encoding="utf-8")
+    except OSError:
+        pass  # cache is best-effort; never fail the fetch over it
+    return data
 
 
 # ------- Pexels -----------------------------------------------------------
 
 
 def _try_pexels(
-    query: str, target: Path, *, client: httpx.Client, api_key: str | None
+    query: str,
+    target: Path,
+    *,
+    client: httpx.Client,
+    api_key: str | None,
+    breaker: _ProviderBreaker,
 ) -> VisualClip | None:
-    if not api_key:
+    if not api_key or not breaker.available("pexels"):
         return None
     try:
-        resp = client.get(
-            "https://api.pexels.com/v1/search",
-            params={"query": query, "orientation": "portrait", "per_page": 5},
-            headers={"Authorization": api_key},
-        )
-        resp.raise_for_status()
-        photos = resp.json().get("photos") or []
+        def fetch() -> dict:
+            resp = client.get(
+                "https://api.pexels.com/v1/search",
+                params={"query": query, "orientation": "portrait", "per_page": 5},
+                headers={"Authorization": api_key},
+            )
+            resp.raise_for_status()
+            return resp.json()
+
+        photos = _cached_search("pexels", query, fetch).get("photos") or []
         if not photos:
+            breaker.record("pexels", ok=True)  # healthy answer, just no match
             return None
         photo = random.choice(photos)
         src = photo.get("src", {})
         image_url = src.get("portrait") or src.get("large") or src.get("original")
         if not image_url:
+            breaker.record("pexels", ok=True)
             return None
         _download(image_url, target, client=client)
+        breaker.record("pexels", ok=True)
         return VisualClip(
             path=str(target),
             source="pexels",
             attribution=f"Photo by {photo.get('photographer', 'Pexels')} on Pexels",
         )
     except Exception as e:
+        breaker.record("pexels", ok=False)
         log.warning("pexels fetch failed for %r: %s", query, e)
         return None
 
@@ -105,26 +283,38 @@ def _try_pexels(
 # ------- Openverse --------------------------------------------------------
 
 
-def _try_openverse(query: str, target: Path, *, client: httpx.Client) -> VisualClip | None:
+def _try_openverse(
+    query: str, target: Path, *, client: httpx.Client, breaker: _ProviderBreaker
+) -> VisualClip | None:
+    if not breaker.available("openverse"):
+        return None
     try:
-        resp = client.get(
-            "https://api.openverse.org/v1/images/",
-            params={
-                "q": query,
-                "license_type": "commercial",
-                "page_size": 5,
-                "aspect_ratio": "tall",
-            },
-        )
-        resp.raise_for_status()
-        results = resp.json().get("results") or []
+        def fetch() -> dict:
+            resp = client.get(
+                "https://api.openverse.org/v1/images/",
+                params={
+                    "q": query,
+                    "license_type": "commercial",
+                    "page_size": 5,
+                    "aspect_ratio": "tall",
+                },
+            )
+            resp.raise_for_status()
+            return resp.json()
+
+        results = _cached_search("openverse", query, fetch).get("results") or []
         if not results:
+            breaker.record("openverse", ok=True)  # healthy answer, just no match
             return None
         photo = random.choice(results)
-        image_url = photo.get("url")
+        # Full asset preferred (cards upscale to 2160px wide in the render);
+        # the pre-sized thumbnail is still better than skipping the result.
+        image_url = photo.get("url") or photo.get("thumbnail")
         if not image_url:
+            breaker.record("openverse", ok=True)
             return None
         _download(image_url, target, client=client)
+        breaker.record("openverse", ok=True)
         return VisualClip(
             path=str(target),
             source="openverse",
@@ -132,14 +322,34 @@ def _try_openverse(query: str, target: Path, *, client: httpx.Client) -> VisualC
             f"({photo.get('license', 'CC')})",
         )
     except Exception as e:
+        breaker.record("openverse", ok=False)
         log.warning("openverse fetch failed for %r: %s", query, e)
         return None
 
 
 def _download(url: str, target: Path, *, client: httpx.Client) -> None:
-    resp = client.get(url)
-    resp.raise_for_status()
-    target.write_bytes(resp.content)
+    """Fetch ``url`` into ``target``, deduplicating downloads by URL hash.
+
+    The same stock photo often wins for several segments (and across jobs,
+    given the search cache). Bytes land once in the shared cache dir; job
+    copies are hardlinks where the filesystem allows, plain copies otherwise.
+    """
+    blob = _search_cache_dir() / ("img_" + hashlib.sha256(url.encode()).hexdigest()[:32])
+    if not blob.exists():
+        tmp = blob.with_name(blob.name + f".{target.name}.tmp")
+        # Stream straight to disk: .content would hold the whole image in
+        # memory once per fetch thread.
+        with client.stream("GET", url) as resp:
+            resp.raise_for_status()
+            with tmp.open("wb") as f:
+                for chunk in resp.iter_bytes(1 << 16):
+                    f.write(chunk)
+        os.replace(tmp, blob)
+    target.unlink(missing_ok=True)
+    try:
+        os.link(blob, target)
+    except OSError:
+        shutil.copyfile(blob, target)
 
 
 # ------- Title-card fallback ---------------------------------------------
@@ -147,20 +357,12 @@ def _download(url: str, target: Path, *, client: httpx.Client) -> None:
 
 def _render_card(*, text: str, title: str, idx: int, target: Path) -> VisualClip:
     """Draw a branded gradient card with the segment text."""
-    from PIL import Image, ImageDraw
-
     W, H = 1080, 1080
     # deterministic palette per segment
     seed = int(hashlib.md5(text.encode()).hexdigest()[:8], 16)
     top, bottom = PALETTE[seed % len(PALETTE)]
 
-    img = Image.new("RGB", (W, H), top)
-    for y in range(H):
-        t = y / (H - 1)
-        r = int(top[0] * (1 - t) + bottom[0] * t)
-        g = int(top[1] * (1 - t) + bottom[1] * t)
-        b = int(top[2] * (1 - t) + bottom[2] * t)
-        ImageDraw.Draw(img).line([(0, y), (W, y)], fill=(r, g, b))
+    img = _gradient_image((W, H), top, bottom).copy()
 
     draw = ImageDraw.Draw(img)
     font_main = _load_font(72)
@@ -181,13 +383,36 @@ def _render_card(*, text: str, title: str, idx: int, target: Path) -> VisualClip
     )
 
     target.parent.mkdir(parents=True, exist_ok=True)
-    img.save(target, format="PNG")
+    # Cards are intermediate render inputs, not deliverables; zlib level 1
+    # saves several times faster than the default 6 for a few % more bytes.
+    img.save(target, format="PNG", compress_level=1)
     return VisualClip(path=str(target), source="generated", attribution="")
 
 
-def _load_font(size: int):
-    from PIL import ImageFont
+@lru_cache(maxsize=len(PALETTE))
+def _gradient_image(
+    size: tuple[int, int], top: tuple[int, int, int], bottom: tuple[int, int, int]
+):
+    """Vertical gradient built from PIL's C-level primitives.
+
+    linear_gradient gives a 0→255 ramp; a 256-entry LUT per channel maps it
+    onto the palette endpoints. Replaces a Python loop that drew the card one
+    row at a time (a Draw object and a line call per row). There are only
+    five palettes at one fixed size, so the templates are cached; callers
+    must .copy() before drawing on the result.
+    """
+    ramp = Image.linear_gradient("L").resize(size)
+    bands = [
+        ramp.point([top[c] + (bottom[c] - top[c]) * v // 255 for v in range(256)])
+        for c in range(3)
+    ]
+    return Image.merge("RGB", bands)
 
+
+@lru_cache(maxsize=8)
+def _load_font(size: int):
+    """Resolve the card font once per size; truetype() re-reads and re-parses
+    the font file on every call otherwise."""
     for name in ("DejaVuSans-Bold.ttf", "Arial Bold.ttf", "Arial.ttf"):
         try:
             return ImageFont.truetype(name, size=size)
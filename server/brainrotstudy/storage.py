@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from .config import get_settings
@@ -65,12 +66,20 @@ class JobPaths:
     def log_path(self) -> Path:
         return self.root / "job.log"
 
-    def ensure(self) -> "JobPaths":
+    def ensure(self) -> JobPaths:
         for d in (self.input_dir, self.audio_dir, self.visuals_dir, self.output_dir):
             d.mkdir(parents=True, exist_ok=True)
         return self
 
 
+@lru_cache(maxsize=256)
 def job_paths(job_id: str) -> JobPaths:
+    """Build (and memoize) the path layout for a job.
+
+    JobPaths is immutable and the storage root is fixed per process, so
+    request handlers that hit the same job repeatedly reuse one instance
+    instead of re-resolving the root and rebuilding Path objects. Tests that
+    redirect STORAGE_ROOT clear this cache alongside the settings cache.
+    """
     root = get_settings().resolve_storage() / "jobs" / job_id
     return JobPaths(job_id=job_id, root=root)
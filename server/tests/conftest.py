@@ -11,11 +11,13 @@ import pytest
 def _isolated_storage(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     monkeypatch.setenv("STORAGE_ROOT", str(tmp_path))
     monkeypatch.setenv("DB_PATH", str(tmp_path / "db.sqlite"))
-    # force a fresh Settings + db connection
-    from brainrotstudy import config, db
+    # force a fresh Settings + db connection + path layout
+    from brainrotstudy import config, db, storage
 
     config.get_settings.cache_clear()
+    storage.job_paths.cache_clear()
     db._reset_for_tests()
     yield tmp_path
     db._reset_for_tests()
+    storage.job_paths.cache_clear()
     config.get_settings.cache_clear()
@@ -4,16 +4,20 @@ from __future__ import annotations
 
 import importlib
 import json
+import time
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
 
+from brainrotstudy import db
+from brainrotstudy.schemas import JobStatus
+
 
 @pytest.fixture
 def client(monkeypatch: pytest.MonkeyPatch) -> TestClient:
     # Prevent the background pipeline from firing — we're only testing HTTP wiring.
-    import brainrotstudy.main as main
+    from brainrotstudy import main
 
     monkeypatch.setattr(main, "submit_job", lambda job_id: None)
     # ensure app picks up the freshly monkeypatched attributes
@@ -87,6 +91,32 @@ def test_get_and_delete_job(client: TestClient) -> None:
     assert r.status_code == 404
 
 
+def test_create_job_schedules_pipeline_on_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    """POST /jobs must schedule the pipeline task on the running event loop.
+
+    Regression: submit_job passed as a sync background task ran in a worker
+    thread with no event loop, so every job stayed queued forever. Only the
+    job coroutine is stubbed here — the scheduling path is the real one.
+    """
+    from brainrotstudy import main
+    from brainrotstudy.pipeline import runner
+
+    async def fake_run_job(job_id: str) -> None:
+        db.update_job(job_id, status=JobStatus.SUCCEEDED, progress=100)
+
+    monkeypatch.setattr(runner, "run_job", fake_run_job)
+    with TestClient(main.app) as live_client:
+        r = live_client.post("/jobs", json={"topic": "Scheduling check"})
+        assert r.status_code == 200, r.text
+        job_id = r.json()["id"]
+        deadline = time.monotonic() + 5.0
+        status = r.json()["status"]
+        while status != "succeeded" and time.monotonic() < deadline:
+            time.sleep(0.02)
+            status = live_client.get(f"/jobs/{job_id}").json()["status"]
+        assert status == "succeeded"
+
+
 def test_download_missing_asset_returns_404(client: TestClient) -> None:
     r = client.post("/jobs", json={"topic": "topic"})
     job_id = r.json()["id"]
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from brainrotstudy import cleanup, db
+from brainrotstudy.schemas import JobOptions, JobStatus, utc_now
+from brainrotstudy.storage import job_paths
+
+
+def _make_finished_job(job_id: str, *, age_days: int) -> Path:
+    db.create_job(job_id, title="t", input_kind="topic", input_filename=None, options=JobOptions())
+    db.update_job(job_id, status=JobStatus.SUCCEEDED, progress=100)
+    # backdate updated_at so the job falls outside the retention window
+    stamp = (utc_now() - timedelta(days=age_days)).isoformat()
+    db._connect().execute("UPDATE jobs SET updated_at = ? WHERE id = ?", (stamp, job_id))
+    db._reset_for_tests()  # drop the cached view so the backdated row is re-read
+    root = job_paths(job_id).ensure().root
+    (root / "output" / "video.mp4").write_bytes(b"x" * 2048)
+    return root
+
+
+def test_dir_size_bytes(tmp_path: Path) -> None:
+    (tmp_path / "a").write_bytes(b"x" * 100)
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    (sub / "b").write_bytes(b"x" * 50)
+    assert cleanup.dir_size_bytes(tmp_path) == 150
+    assert cleanup.dir_size_bytes(tmp_path / "missing") == 0
+
+
+def test_cleanup_removes_only_expired_jobs(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RETENTION_DAYS", "14")
+    from brainrotstudy import config
+
+    config.get_settings.cache_clear()
+
+    old_root = _make_finished_job("oldjob0001", age_days=30)
+    fresh_root = _make_finished_job("freshjob01", age_days=1)
+
+    removed = cleanup.cleanup_old_jobs()
+    assert removed == 1
+    assert db.get_job("oldjob0001") is None
+    assert not old_root.exists()
+    assert db.get_job("freshjob01") is not None
+    assert fresh_root.exists()
+
+
+def test_cleanup_disabled_by_default() -> None:
+    _make_finished_job("oldjob0002", age_days=365)
+    assert cleanup.cleanup_old_jobs() == 0
+    assert db.get_job("oldjob0002") is not None
@@ -1,5 +1,7 @@
+from datetime import timedelta
+
 from brainrotstudy import db
-from brainrotstudy.schemas import JobOptions, JobStage, JobStatus, Vibe
+from brainrotstudy.schemas import JobOptions, JobStage, JobStatus, Vibe, utc_now
 
 
 def test_crud_roundtrip() -> None:
@@ -26,3 +28,24 @@ def test_crud_roundtrip() -> None:
 
     assert db.delete_job("abc12345") is True
     assert db.get_job("abc12345") is None
+
+
+def _make_job(job_id: str, *, status: JobStatus, age_days: int) -> None:
+    db.create_job(job_id, title="t", input_kind="topic", input_filename=None, options=JobOptions())
+    db.update_job(job_id, status=status, progress=100)
+    stamp = (utc_now() - timedelta(days=age_days)).isoformat()
+    db._connect().execute("UPDATE jobs SET updated_at = ? WHERE id = ?", (stamp, job_id))
+    db._reset_for_tests()  # drop the cached view so the backdated row is re-read
+
+
+def test_list_finished_before_returns_only_expired_finished_jobs() -> None:
+    cutoff = utc_now() - timedelta(days=14)
+    _make_job("oldsuccess", status=JobStatus.SUCCEEDED, age_days=40)
+    _make_job("oldfailure", status=JobStatus.FAILED, age_days=30)
+    _make_job("oldrunning", status=JobStatus.RUNNING, age_days=30)
+    _make_job("freshdone1", status=JobStatus.SUCCEEDED, age_days=1)
+
+    expired = db.list_finished_before(cutoff)
+    # oldest first; running and fresh jobs are never returned
+    assert [v.id for v in expired] == ["oldsuccess", "oldfailure"]
+    assert db.list_finished_before(cutoff, limit=1)[0].id == "oldsuccess"
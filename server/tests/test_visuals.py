@@ -67,3 +67,22 @@ def test_fetch_visuals_falls_back_to_title_card(tmp_path: Path) -> None:
     assert clips[0].source == "generated"
     assert Path(clips[0].path).exists()
     assert Path(clips[0].path).stat().st_size > 1000  # real PNG
+
+
+def test_prune_cache_drops_only_expired_entries() -> None:
+    import os
+    import time
+
+    from brainrotstudy.pipeline import visuals
+
+    cache_dir = visuals._search_cache_dir()
+    stale = cache_dir / "img_deadbeef"
+    fresh = cache_dir / "pexels_cafe.json"
+    stale.write_bytes(b"x")
+    fresh.write_text("{}")
+    old = time.time() - visuals._SEARCH_CACHE_TTL_SEC - 60
+    os.utime(stale, (old, old))
+
+    assert visuals.prune_cache() == 1
+    assert not stale.exists()
+    assert fresh.exists()